@@ -8,7 +8,7 @@ import logging
 import sys
 from typing import NoReturn, Dict, Any, Optional, TypedDict, Callable
 from config import get_client_config
-from socket_adapter.client_adapter import connect, disconnect, send_message, start_message_handler
+from socket_adapter.client_adapter import connect, disconnect, run_message_writer, start_message_handler
 from ui_adapter.terminal.lobby_table_output import run_terminal_ui_adapter
 from services.state import get_lobby_state, set_lobby_state
 
@@ -37,7 +37,7 @@ def update_token(state: ClientState, token: str) -> ClientState:
     return {**state, "token": token}
 
 # Message handlers
-def create_message_handlers(state: ClientState, set_state: Callable[[ClientState], None], websocket_client: Any) -> Dict[str, Any]:
+def create_message_handlers(state: ClientState, set_state: Callable[[ClientState], None], outgoing: asyncio.Queue) -> Dict[str, Any]:
     """Create message handler functions."""
     def handle_lobby_update(payload: Dict[str, Any]) -> None:
         """Update local lobby state."""
@@ -55,7 +55,7 @@ def create_message_handlers(state: ClientState, set_state: Callable[[ClientState
             set_state(new_state)
             logger.debug(f"Updated client state with token: {token}")
             # Request lobby refresh immediately after getting token
-            asyncio.create_task(send_message(websocket_client, 'get_lobby_status', {}))
+            outgoing.put_nowait(('get_lobby_status', {}))
 
     return {
         'lobby_update': handle_lobby_update,
@@ -84,9 +84,13 @@ async def run_client() -> NoReturn:
         client = await connect(f"ws://{config['server_host']}:{config['port']}")
         logger.info("Connected to server.")
 
+        # Messages sent from handlers go through one writer task
+        outgoing = asyncio.Queue(maxsize=64)
+        writer_task = asyncio.create_task(run_message_writer(client, outgoing))
+
         # Start message handling with state management
         message_task = asyncio.create_task(
-            start_message_handler(client, create_message_handlers(state, set_state, client))
+            start_message_handler(client, create_message_handlers(state, set_state, outgoing))
         )
 
         # Give message handler a chance to initialize
@@ -97,23 +101,21 @@ async def run_client() -> NoReturn:
             run_terminal_ui_adapter(client, state["token"])
         )
 
-        # Wait for both tasks to complete
+        # Run until the server closes the connection, the user exits or the writer fails
+        # (it only ends on a send error), then stop the rest.
+        pending = {message_task, ui_task, writer_task}
         try:
-            await asyncio.gather(message_task, ui_task)
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            pending -= done
+            for task in done:
+                task.result()  # Re-raise the error of a failed task, e.g. the writer's ConnectionError
         except asyncio.CancelledError:
             logger.info("Tasks cancelled")
-            # Cancel both tasks
-            message_task.cancel()
-            ui_task.cancel()
-            try:
-                await message_task
-            except asyncio.CancelledError:
-                pass
-            try:
-                await ui_task
-            except asyncio.CancelledError:
-                pass
             raise
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
 
     except (asyncio.CancelledError, KeyboardInterrupt) as e:
         logger.info("Disconnecting from server...")
@@ -129,10 +131,19 @@ async def run_client() -> NoReturn:
             await disconnect(client)
         raise
 
+def run_event_loop(coroutine: Any) -> None:
+    """Run coroutine on uvloop if it is installed, otherwise on the default asyncio loop."""
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(coroutine)
+        return
+    uvloop.run(coroutine)
+
 def main() -> NoReturn:
     """Main entry point."""
     try:
-        asyncio.run(run_client())
+        run_event_loop(run_client())
     except KeyboardInterrupt:
         pass
 
@@ -3,56 +3,84 @@ Configuration settings for the application.
 Uses immutable data structures and functional approach.
 """
 
-from typing import Literal, Union, Dict, Any
+from typing import Literal, Union, Dict, Any, Mapping
 from functools import partial
 from pathlib import Path
-import json
+import orjson
+from frozendict import frozendict
 
 # Config file path relative to this file
 CONFIG_PATH = Path(__file__).parent / 'config.json'
 
-def read_config() -> dict:
-    """Read config from file, return default if file doesn't exist."""
+def _freeze(value: Any) -> Any:
+    """Convert parsed JSON into frozendicts and tuples, so it can be shared safely."""
+    if isinstance(value, dict):
+        return frozendict({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+# Used when no config file exists
+_DEFAULT_CONFIG = _freeze({
+    'server': {
+        'game_port': 8001,
+        'lobby_port': 8002,
+        'host': 'localhost'
+    },
+    'client': {
+        'server_host': 'localhost',
+        'game_port': 8001,
+        'lobby_port': 8002
+    }
+})
+
+# Main data structure defined globally but only used through functions
+_cached_key = None     # (path, mtime) of the last read config file
+_cached_config = None  # Frozen config parsed from that file
+
+def read_config() -> Mapping[str, Any]:
+    """
+    Read config from file, return default if file doesn't exist.
+    The parsed file is reused until its modification time changes;
+    it is frozen, so callers cannot change the shared copy.
+    """
+    global _cached_key, _cached_config
     try:
-        with open(CONFIG_PATH) as f:
-            return json.load(f)
+        key = (CONFIG_PATH, CONFIG_PATH.stat().st_mtime_ns)
+        if _cached_key != key:
+            with open(CONFIG_PATH, 'rb') as f:
+                _cached_config = _freeze(orjson.loads(f.read()))
+            _cached_key = key
+        return _cached_config
     except FileNotFoundError:
-        return {
-            'server': {
-                'game_port': 8001,
-                'lobby_port': 8002,
-                'host': 'localhost'
-            },
-            'client': {
-                'server_host': 'localhost',
-                'game_port': 8001,
-                'lobby_port': 8002
-            }
-        }
-
-def write_config(config: dict) -> None:
-    """Write config to file."""
-    with open(CONFIG_PATH, 'w') as f:
-        json.dump(config, f, indent=2)
-
-def get_server_config() -> Dict[str, Any]:
+        return _DEFAULT_CONFIG
+
+def write_config(config: Mapping[str, Any]) -> None:
+    """Write config to file and keep it as the cached config."""
+    global _cached_key, _cached_config
+    with open(CONFIG_PATH, 'wb') as f:
+        f.write(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+    _cached_config = _freeze(dict(config))
+    _cached_key = (CONFIG_PATH, CONFIG_PATH.stat().st_mtime_ns)
+
+def get_server_config() -> Mapping[str, Any]:
     """Get server configuration."""
     return read_config()['server']
 
-def get_client_config() -> Dict[str, Any]:
+def get_client_config() -> Mapping[str, Any]:
     """Get client configuration."""
     return read_config()['client']
 
 def update_server_config(updates: Dict[str, Any]) -> Dict[str, Any]:
     """Update server configuration."""
     config = read_config()
-    config['server'].update(updates)
+    config = {**config, 'server': {**config['server'], **updates}}
     write_config(config)
     return config['server']
 
 def update_client_config(updates: Dict[str, Any]) -> Dict[str, Any]:
     """Update client configuration."""
     config = read_config()
-    config['client'].update(updates)
+    config = {**config, 'client': {**config['client'], **updates}}
     write_config(config)
     return config['client']
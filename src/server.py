@@ -4,6 +4,7 @@ Server entry point.
 Runs the WebSocket server with game and lobby functionality.
 """
 import asyncio
+import signal
 from typing import NoReturn
 from config import get_server_config
 from socket_adapter.server_adapter import create_server, start_server, stop_server
@@ -13,17 +14,32 @@ async def run_server() -> NoReturn:
     config = get_server_config()
     server = None
 
+    # Set on SIGINT/SIGTERM or when the server task ends
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except NotImplementedError:
+            pass  # Windows: Ctrl+C still raises KeyboardInterrupt
+
     try:
         # Create and start server
         print(f"Starting server on port {config['port']}...")
         server = create_server(config['port'])  # No await needed - just creates state
-        await start_server(server)  # await needed - actually starts server
+        server_task = asyncio.create_task(start_server(server))  # Serves until stopped
+        server_task.add_done_callback(lambda _: stop.set())
 
         print("Server running. Press Ctrl+C to stop.")
 
-        # Keep running until interrupted
-        while True:
-            await asyncio.sleep(1)
+        # Sleep until stopped, without periodic wakeups
+        await stop.wait()
+        if server_task.done():
+            server_task.result()  # Re-raise a failed start
+
+        print("\nShutting down server...")
+        await stop_server(server)
+        print("Server stopped.")
 
     except (asyncio.CancelledError, KeyboardInterrupt) as e:
         print("\nShutting down server...")
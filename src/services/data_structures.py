@@ -1,7 +1,8 @@
 # data_structures.py
 
 from frozendict import frozendict
-from typing import Dict, Tuple, Any, Union, Optional, TypedDict
+from functools import lru_cache
+from typing import Dict, Tuple
 from datetime import datetime
 
 """
@@ -39,8 +40,8 @@ GameDict: {
     announcements: Tuple[AnnouncementDict, ...] # Made announcements
     tricks: Dict[int, Tuple[Tuple[str, CardDict], ...]] # Played tricks
     score: Dict                             # Round scores
-    start_time: datetime                    # Round start
-    end_time: Optional[datetime]            # Round end
+    start_time: str                         # Round start (ISO 8601)
+    end_time: Optional[str]                 # Round end (ISO 8601)
     players: Tuple[PlayerDict, ...]         # Participating players
     final_score: Dict                       # Final round score
 }
@@ -56,6 +57,9 @@ LobbyStatusDict: {
     players: Tuple[PlayerDict, ...]   # Connected players
     tables: Tuple[TableDict, ...]     # Active tables
 }
+
+All records are frozendicts: immutable and hashable, so cards and players
+can be used as dict keys and set members without conversion.
 """
 
 # Constants using immutable types
@@ -65,13 +69,17 @@ GAME_MODES = ("normal", "solo")
 GAME_PHASES = ("variant", "armut", "playing")
 ANNOUNCEMENT_TYPES = ("re", "kontra", "no90", "no60", "no30", "schwarz")
 TEAM_TYPES = ("re", "kontra", "unknown")
+TEAM_RE, TEAM_KONTRA, TEAM_UNKNOWN = TEAM_TYPES
+
+# Immutable, so a single empty lobby can be shared by every caller
+_EMPTY_LOBBY = frozendict({
+    "players": tuple(),  # Use tuple instead of list for immutability
+    "tables": tuple()
+})
 
 def create_empty_lobby() -> Dict:
     """Create an empty lobby status."""
-    return frozendict({
-        "players": tuple(),  # Use tuple instead of list for immutability
-        "tables": tuple()
-    })
+    return _EMPTY_LOBBY
 
 def create_player(session: str, name: str, type_: str, uuid: str) -> Dict:
     """Create an immutable player dictionary"""
@@ -82,8 +90,9 @@ def create_player(session: str, name: str, type_: str, uuid: str) -> Dict:
         "uuid": uuid
     })
 
+@lru_cache(maxsize=None)
 def create_card(suit: str, rank: str, value: int, is_trump: bool) -> Dict:
-    """Create an immutable card dictionary"""
+    """Create an immutable card dictionary, shared between equal cards"""
     return frozendict({
         "suit": suit,
         "rank": rank,
@@ -1,67 +1,93 @@
 # Game Handler
 # This file will contain functions for game mechanics and state management
 
-from typing import Dict, Tuple, List, Optional
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 from datetime import datetime
-from functools import reduce
+from itertools import islice
 import random
-from .data_structures import (
-    create_player, create_table, create_card,
-    GAME_MODES, GAME_PHASES, TEAM_TYPES
+from frozendict import frozendict
+from .data_structures import create_card, TEAM_RE, TEAM_KONTRA, TEAM_UNKNOWN
+
+# Default random source; callers may pass their own random.Random instead
+_RNG = random.Random()
+
+# (suit, rank, value, is_trump) of the 20 distinct cards
+_CARD_SPECS = tuple(
+    (suit, rank, value, (suit == "diamonds") or (suit == "clubs" and rank == "queen"))
+    for suit in ("hearts", "spades", "diamonds", "clubs")
+    for rank, value in (
+        ("ace", 11), ("ten", 10), ("king", 4),
+        ("queen", 3), ("jack", 2)  # Removed nine to get 40 cards total (10 per player)
+    )
 )
 
-def play_round(table: Dict, _: int) -> Dict:
-    """Play a single round and determine if more rounds should be played"""
-    if table["status"] == "closed":
-        return table
-    return gameflow(table)
+# The deck never changes, so it is built once at import and shared by all rounds.
+# Cards are frozendicts, so handing out the same tuple is safe.
+_UNIQUE_CARDS = tuple(create_card(*spec) for spec in _CARD_SPECS)
+_DECK = _UNIQUE_CARDS * 2  # Each card appears twice
+
+# Optional observer of game states, e.g. functools.partial(game_logger.log_game_state, game_id)
+GameStateLog = Optional[Callable[[Dict], None]]
 
-def play_table_rounds(table: Dict) -> Dict:
+# Input-independent part of a new game; empty mappings are frozendicts so every round can share them
+_INITIAL_GAME_STATE = frozendict({
+    "cards": frozendict(),           # Player hands
+    "current_player": "",            # UUID of current player
+    "eligible_cards": (),            # Playable cards
+    "mode": "normal",                # Game mode
+    "phase": "variant",              # Game phase
+    "eligible_announcements": frozendict(),  # Possible announcements
+    "player_teams": frozendict(),    # Player team assignments
+    "announcements": (),             # Made announcements
+    "tricks": (),                    # Played tricks as tuple of tuples
+    "score": frozendict(),           # Round scores
+    "start_time": None,              # Round start
+    "end_time": None,                # Round end
+    "players": (),                   # Participating players
+    "final_score": frozendict()      # Final round score
+})
+
+def play_table_rounds(table: Dict, log: GameStateLog = None) -> Dict:
     """
-    Play all rounds for a table in a functional way.
+    Play all rounds for a table.
     
     Args:
         table: The table to play rounds for
+        log: Optional callback passed on to gameflow() for every round
         
     Returns:
         Updated table with all rounds completed
         
     This function manages the complete lifecycle of a table by:
     1. Getting the number of rounds to play from table settings
-    2. Using reduce to functionally apply gameflow() for each round
+    2. Applying gameflow() for each round until the table is closed
     3. Returning the final table state with all rounds
     """
-    return reduce(
-        play_round,
-        range(table.get("num_rounds", 1)),
-        table
-    )
+    rng = random.Random()  # Own random source per table
+    for _ in range(table.get("num_rounds", 1)):
+        if table["status"] == "closed":
+            break
+        table = gameflow(table, rng, log)
+    return table
 
 def create_initial_game_state(players: Tuple[Dict, ...]) -> Dict:
     """Create initial game state without any mutations"""
     return {
-        "cards": {},           # Player hands
-        "current_player": "",  # UUID of current player
-        "eligible_cards": (),  # Playable cards
-        "mode": "normal",      # Game mode
-        "phase": "variant",    # Game phase
-        "eligible_announcements": {},  # Possible announcements
-        "player_teams": {p["uuid"]: "unknown" for p in players},  # Player team assignments
-        "announcements": (),   # Made announcements
-        "tricks": (),          # Played tricks as tuple of tuples
-        "score": {},          # Round scores
-        "start_time": datetime.now(),  # Round start
-        "end_time": None,     # Round end
-        "players": players,    # Participating players
-        "final_score": {}     # Final round score
+        **_INITIAL_GAME_STATE,
+        "player_teams": dict.fromkeys((p["uuid"] for p in players), TEAM_UNKNOWN),  # Player team assignments
+        "start_time": datetime.now().isoformat(),  # Round start, stored as text once
+        "players": players     # Participating players
     }
 
-def gameflow(table: Dict) -> Dict:
+def gameflow(table: Dict, rng: random.Random = _RNG, log: GameStateLog = None) -> Dict:
     """
     Manages the game flow for a table through all phases in a functional way.
     
     Args:
         table: The table to manage game flow for
+        rng: Random source for shuffling, first player and teams
+        log: Optional callback, called with the game state after every trick
+             and once more when the round is complete
         
     Returns:
         Updated table with new game state
@@ -93,33 +119,26 @@ def gameflow(table: Dict) -> Dict:
        - Calculate round scores
        - Update game summary
     """
-    initial_state = create_initial_game_state(table["players"])
-    initial_state["player_teams"] = assign_teams(table["players"])  # Assign teams at start
-    
-    return create_updated_table(
-        table,
-        reduce(
-            lambda game, fn: fn(game),
-            [
-                initialize_game,
-                handle_variant_phase,
-                lambda g: handle_poverty_phase(g) if g["mode"] == "armut" else g,
-                play_all_tricks,
-                finalize_game
-            ],
-            initial_state
-        )
-    )
+    game = create_initial_game_state(table["players"])
+    game["player_teams"] = assign_teams(table["players"], rng)  # Assign teams at start
+
+    game = initialize_game(game, rng)
+    game = handle_variant_phase(game)
+    if game["mode"] == "armut":
+        game = handle_poverty_phase(game)
+    game = play_all_tricks(game, log)
+    game = finalize_game(game)
+    if log:
+        log(game)
+
+    return create_updated_table(table, game)
 
-def initialize_game(game: Dict) -> Dict:
+def initialize_game(game: Dict, rng: random.Random = _RNG) -> Dict:
     """Initialize game state with cards and first player in a functional way"""
     return {
         **game,
-        "cards": distribute_cards(
-            shuffle_cards(create_cards()),
-            game["players"]
-        ),
-        "current_player": determine_first_player(game["players"])
+        "cards": deal_cards(game["players"], rng),
+        "current_player": determine_first_player(game["players"], rng)
     }
 
 def handle_variant_phase(game: Dict) -> Dict:
@@ -129,66 +148,72 @@ def handle_variant_phase(game: Dict) -> Dict:
         "mode": "normal"  # For now, always normal mode
     }
 
-def play_all_tricks(game: Dict) -> Dict:
-    """Play all tricks in a functional way"""
-    return reduce(
-        play_trick,
-        range(10),
-        {**game, "phase": "playing"}
-    )
+def play_all_tricks(game: Dict, log: GameStateLog = None) -> Dict:
+    """
+    Play all tricks on a single private copy of the game state.
+    If log is given, it is called with the state after every trick.
+    """
+    game = {**game, "phase": "playing"}
+    rotations = _seat_rotations(game["players"])  # Seating never changes within a round
+    for trick_number in range(10):
+        game.update(_play_trick_updates(game, trick_number, rotations))
+        if log:
+            log(game)  # The working copy keeps changing; loggers must copy what they keep
+    return game
 
 def finalize_game(game: Dict) -> Dict:
     """Calculate final scores and end game in a functional way"""
+    score = calculate_round_score(game)  # Computed once; both keys share the same result
     return {
         **game,
         "phase": "complete",
-        "score": calculate_round_score(game),
-        "final_score": calculate_round_score(game),
-        "end_time": datetime.now()
+        "score": score,
+        "final_score": score,
+        "end_time": datetime.now().isoformat()
     }
 
 def create_updated_table(table: Dict, game: Dict) -> Dict:
     """Create new table state with updated rounds in a functional way"""
-    current_rounds = table.get("rounds", ())
-    if isinstance(current_rounds, list):
-        current_rounds = tuple(current_rounds)
-    elif current_rounds is None:
-        current_rounds = ()
+    # Single pass into a new tuple; also accepts a list or missing rounds
+    new_rounds = (*(table.get("rounds") or ()), game)
+    num_rounds = table.get("num_rounds", 1)
     return {
         **table,
-        "rounds": current_rounds + (game,),
-        "status": "waiting" if len(current_rounds) + 1 < table.get("num_rounds", 1) else "closed"
+        "rounds": new_rounds,
+        "status": "waiting" if len(new_rounds) < num_rounds else "closed"
     }
 
 def create_cards() -> Tuple[Dict, ...]:
-    """Create a complete deck of Doppelkopf cards in a functional way"""
-    return tuple(
-        create_card(suit, rank, value, (suit == "diamonds") or (suit == "clubs" and rank == "queen"))
-        for _ in range(2)  # Each card appears twice
-        for suit in ("hearts", "spades", "diamonds", "clubs")
-        for rank, value in (
-            ("ace", 11), ("ten", 10), ("king", 4),
-            ("queen", 3), ("jack", 2)  # Removed nine to get 40 cards total (10 per player)
-        )
-    )
+    """Return the complete deck of Doppelkopf cards (shared, immutable)"""
+    return _DECK
 
-def shuffle_cards(cards: Tuple[Dict, ...]) -> Tuple[Dict, ...]:
+def shuffle_cards(cards: Tuple[Dict, ...], rng: random.Random = _RNG) -> Tuple[Dict, ...]:
     """Create new shuffled tuple of cards in a functional way"""
-    return tuple(random.sample(cards, len(cards)))
+    return tuple(_shuffled(cards, rng))
 
-def distribute_cards(cards: Tuple[Dict, ...], players: Tuple[Dict, ...]) -> Dict[str, Tuple[Dict, ...]]:
+def distribute_cards(cards: Sequence[Dict], players: Tuple[Dict, ...]) -> Dict[str, Tuple[Dict, ...]]:
     """Distribute cards to players in a functional way"""
-    return {} if not players or not cards else {
-        uuid: tuple(cards[i:i + len(cards) // len(players)])
-        for i, uuid in enumerate(
-            tuple(p["uuid"] for p in players),
-            start=0
-        )
-    }
+    if not players or not cards:
+        return {}
+    hand_size = len(cards) // len(players)
+    # Walk the cards once; each player gets the next hand_size cards (none if too few cards)
+    remaining = iter(cards)
+    return {p["uuid"]: tuple(islice(remaining, hand_size)) for p in players}
+
+def deal_cards(players: Tuple[Dict, ...], rng: random.Random = _RNG) -> Dict[str, Tuple[Dict, ...]]:
+    """Shuffle the deck and deal it to players in a single pass"""
+    # One shuffled list, walked once into the hands; no intermediate tuple or slices
+    return distribute_cards(_shuffled(create_cards(), rng), players)
+
+def _shuffled(cards: Sequence[Dict], rng: random.Random) -> List[Dict]:
+    """Shuffled private list copy of cards; the input is left unchanged"""
+    shuffled = list(cards)
+    rng.shuffle(shuffled)
+    return shuffled
 
-def determine_first_player(players: Tuple[Dict, ...]) -> str:
+def determine_first_player(players: Tuple[Dict, ...], rng: random.Random = _RNG) -> str:
     """Determine which player goes first in a functional way"""
-    return next((p["uuid"] for p in random.sample(players, 1)), "")
+    return rng.choice(players)["uuid"] if players else ""
 
 def handle_poverty_phase(game: Dict) -> Dict:
     """Handle poverty phase, returning new state"""
@@ -196,27 +221,33 @@ def handle_poverty_phase(game: Dict) -> Dict:
 
 def play_trick(game: Dict, trick_number: int) -> Dict:
     """Play a single trick, returning new state in a functional way"""
+    updates = _play_trick_updates(game, trick_number)
+    return {**game, **updates} if updates else game
+
+def _seat_rotations(players: Tuple[Dict, ...]) -> Dict[str, Tuple[str, ...]]:
+    """Map each player's uuid to the seating order starting with that player"""
+    seats = tuple(p["uuid"] for p in players)
+    return {uuid: seats[i:] + seats[:i] for i, uuid in enumerate(seats)}
+
+def _play_trick_updates(
+    game: Dict, trick_number: int, rotations: Optional[Dict[str, Tuple[str, ...]]] = None
+) -> Dict:
+    """
+    Compute the game keys changed by playing a single trick.
+    rotations comes from _seat_rotations; it is built here when not passed in.
+    """
     # Get current player's cards
-    player_uuid = game["current_player"]
-    player_cards = game["cards"][player_uuid]
+    current_player = game["current_player"]
     
     # If no cards left, skip this trick
-    if not player_cards:
-        return game
-    
-    # Play first card from player's hand
-    played_card = player_cards[0]
-    remaining_cards = player_cards[1:]
+    if not game["cards"][current_player]:
+        return {}
+    current_cards = dict(game["cards"])  # One private copy per trick, updated in place below
     
     # Create trick with all players playing their first card
     trick = []
-    current_cards = game["cards"]
-    current_player = player_uuid
-    players_in_order = list(p["uuid"] for p in game["players"])
-    start_idx = players_in_order.index(current_player)
-    
-    # Rotate player list so current player is first
-    players_in_order = players_in_order[start_idx:] + players_in_order[:start_idx]
+    # Seating order rotated so current player is first
+    players_in_order = (rotations or _seat_rotations(game["players"]))[current_player]
     
     # Each player plays one card
     for player_id in players_in_order:
@@ -225,10 +256,7 @@ def play_trick(game: Dict, trick_number: int) -> Dict:
             continue
         card = player_cards[0]
         trick.append({"player": player_id, "card": card})
-        current_cards = {
-            **current_cards,
-            player_id: player_cards[1:]
-        }
+        current_cards[player_id] = player_cards[1:]
     
     # Find next player with cards
     next_player = None
@@ -241,31 +269,31 @@ def play_trick(game: Dict, trick_number: int) -> Dict:
     if next_player is None:
         next_player = current_player
     
-    # Update game state
+    # Changed game state
     return {
-        **game,
         "tricks": game["tricks"] + (tuple(trick),),
         "cards": current_cards,
         "current_player": next_player
     }
 
-def assign_teams(players: Tuple[Dict, ...]) -> Dict[str, str]:
+def assign_teams(players: Tuple[Dict, ...], rng: random.Random = _RNG) -> Dict[str, str]:
     """Assign teams to players in a functional way"""
     player_uuids = tuple(p["uuid"] for p in players)
-    # Randomly select 2 players for Re team
-    re_players = tuple(random.sample(player_uuids, 2))
-    return {
-        uuid: "re" if uuid in re_players else "kontra"
-        for uuid in player_uuids
-    }
+    teams = dict.fromkeys(player_uuids, TEAM_KONTRA)
+    # Randomly select 2 distinct players for Re team; seat order of the dict is kept
+    first = rng.randrange(len(player_uuids))
+    second = rng.randrange(len(player_uuids) - 1)
+    second += second >= first  # Skip over the first pick
+    teams[player_uuids[first]] = teams[player_uuids[second]] = TEAM_RE
+    return teams
 
 def all_teams_known(player_teams: Dict[str, str]) -> bool:
     """Check if all player teams are known"""
-    return all(team != "unknown" for team in player_teams.values())
+    return TEAM_UNKNOWN not in player_teams.values()
 
 def calculate_round_score(game: Dict) -> Dict:
     """Calculate the score for the round"""
     return {
-        "re": 2,
-        "kontra": 1
+        TEAM_RE: 2,
+        TEAM_KONTRA: 1
     }
@@ -1,2 +1,123 @@
 # Game Logger
-# This file will handle logging of game state after every turn
+# This file handles logging of game state after every turn.
+# Records are queued and written as JSON lines by a background thread, one file per game.
+
+import atexit
+import logging
+import queue
+import threading
+import orjson
+from functools import lru_cache
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+LOGS_DIR = Path("logs")
+MAX_BATCH = 64  # Records drained from the queue per write
+
+logger = logging.getLogger(__name__)
+
+# Main data structure defined globally but only used through functions
+_LOG_QUEUE: "queue.Queue[Tuple[str, Dict]]" = queue.Queue(maxsize=1024)
+_LOG_INDEX: Dict[Path, Dict[str, Path]] = {}  # logs dir -> game_id -> log file
+_INDEX_LOCK = threading.Lock()  # Index is updated by the writer thread
+_writer: Optional[threading.Thread] = None  # Started by the first log_game_state call
+_WRITER_LOCK = threading.Lock()
+
+def ensure_logs_directory() -> Path:
+    """Create the logs directory once per process and return its path."""
+    return _create_directory(LOGS_DIR)
+
+def log_game_state(game_id: str, game: Dict) -> None:
+    """
+    Queue a snapshot of the game state for the writer thread, starting it on first use.
+    Only blocks when the queue is full, so the game loop does not wait on disk I/O.
+    """
+    _ensure_writer()
+    _LOG_QUEUE.put((game_id, {**game}))  # Shallow copy: callers may keep updating their dict
+
+def flush_logs() -> None:
+    """Wait until all queued records have been written."""
+    _LOG_QUEUE.join()
+
+def get_game_logs(game_id: Optional[str] = None) -> Tuple[Path, ...]:
+    """
+    Get the log files of one game, or of all games if no id is given.
+    Served from an in-memory index; the directory is only scanned on first use.
+    """
+    with _INDEX_LOCK:
+        index = _load_index(LOGS_DIR)
+        if game_id:
+            return (index[game_id],) if game_id in index else ()
+        return tuple(sorted(index.values()))
+
+def load_game_log(path: Path) -> Tuple[Dict, ...]:
+    """Load all game states recorded in a log file, in logging order."""
+    with open(path, "rb") as f:
+        return tuple(orjson.loads(line) for line in f if line.strip())
+
+def _ensure_writer() -> None:
+    global _writer
+    with _WRITER_LOCK:
+        if _writer is None:
+            _writer = threading.Thread(target=_writer_loop, name="game-logger", daemon=True)
+            _writer.start()
+            atexit.register(flush_logs)
+
+def _writer_loop() -> None:
+    while True:
+        batch = [_LOG_QUEUE.get()]
+        while len(batch) < MAX_BATCH:
+            try:
+                batch.append(_LOG_QUEUE.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            _write_batch(batch)
+        except Exception:  # A bad batch must not stop the thread, or flush_logs would wait forever
+            logger.exception(f"Failed to write {len(batch)} game log records")
+        finally:
+            for _ in batch:
+                _LOG_QUEUE.task_done()
+
+def _write_batch(batch: List[Tuple[str, Dict]]) -> None:
+    # One append per game file for the whole batch
+    lines_by_game: Dict[str, List[bytes]] = {}
+    for game_id, game in batch:
+        lines_by_game.setdefault(game_id, []).append(_serialize(game))
+
+    logs_dir = ensure_logs_directory()
+    with _INDEX_LOCK:
+        index = _load_index(logs_dir)
+        paths = {
+            game_id: index.get(game_id) or _new_log_path(logs_dir, game_id)
+            for game_id in lines_by_game
+        }
+    for game_id, lines in lines_by_game.items():
+        with open(paths[game_id], "ab") as f:
+            f.write(b"\n".join(lines) + b"\n")
+
+    with _INDEX_LOCK:
+        _load_index(logs_dir).update(paths)
+
+def _load_index(logs_dir: Path) -> Dict[str, Path]:
+    # Caller holds _INDEX_LOCK
+    if logs_dir not in _LOG_INDEX:
+        _LOG_INDEX[logs_dir] = {
+            path.stem.split("_game_", 1)[1]: path for path in logs_dir.glob("*_game_*.jsonl")
+        }
+    return _LOG_INDEX[logs_dir]
+
+def _new_log_path(logs_dir: Path, game_id: str) -> Path:
+    # Timestamp is formatted once, when a game's file is created; later batches reuse the indexed path
+    return logs_dir / f"{datetime.now():%Y%m%d_%H%M%S}_game_{game_id}.jsonl"
+
+@lru_cache(maxsize=None)
+def _create_directory(path: Path) -> Path:
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+def _serialize(game: Dict) -> bytes:
+    # orjson writes compact output; datetime values are also handled natively.
+    # Non-string keys (e.g. trick numbers) are written as strings.
+    return orjson.dumps(game, default=str, option=orjson.OPT_NON_STR_KEYS)
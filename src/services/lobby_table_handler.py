@@ -1,8 +1,7 @@
 # lobby_table_handler.py
 
-from typing import Tuple, List, Dict, Any, Callable, Optional, Union
+from typing import Tuple, Dict, Any, Optional
 import random
-from .game_handler import play_table_rounds
 from .data_structures import create_empty_lobby, create_player, create_table as create_table_dict
 
 # Type aliases
@@ -49,8 +48,6 @@ def login_player(status: LobbyStatusType, name: str) -> Result:
         "players": status["players"] + (player,),  # Convert to tuple
         "tables": status["tables"]
     }
-    print(f"Created player: {player}")  # Debug print
-    print(f"New lobby status: {new_status}")  # Debug print
     return create_result(True, (new_status, player))
 
 def create_table(status: LobbyStatusType, name: str, rounds: int) -> Result:
@@ -72,6 +69,16 @@ def create_table(status: LobbyStatusType, name: str, rounds: int) -> Result:
     }
     return create_result(True, (new_status, table))
 
+def replace_table(tables: Tuple[TableType, ...], updated_table: TableType) -> Tuple[TableType, ...]:
+    """Return tables with the table of the same name swapped for updated_table."""
+    index = next(
+        (i for i, t in enumerate(tables) if t["tablename"] == updated_table["tablename"]),
+        None
+    )
+    if index is None:
+        return tables
+    return tables[:index] + (updated_table,) + tables[index + 1:]
+
 def add_player_to_table(status: LobbyStatusType, table: TableType, player_name: str) -> Result:
     """Add player to table if space available."""
     if len(table["players"]) >= 4:
@@ -82,15 +89,9 @@ def add_player_to_table(status: LobbyStatusType, table: TableType, player_name:
         "players": table["players"] + (player_name,)  # Convert to tuple
     }
     
-    # Convert list comprehension to tuple
-    updated_tables = tuple(
-        updated_table if t["tablename"] == table["tablename"] else t
-        for t in status["tables"]
-    )
-    
     new_status = {
         "players": status["players"],
-        "tables": updated_tables
+        "tables": replace_table(status["tables"], updated_table)
     }
     
     return create_result(True, (new_status, True, updated_table))
@@ -106,15 +107,9 @@ def start_table(status: LobbyStatusType, table: TableType) -> Result:
         "rounds": tuple()  # Empty tuple
     }
     
-    # Convert list comprehension to tuple
-    updated_tables = tuple(
-        updated_table if t["tablename"] == table["tablename"] else t
-        for t in status["tables"]
-    )
-    
     new_status = {
         "players": status["players"],
-        "tables": updated_tables
+        "tables": replace_table(status["tables"], updated_table)
     }
     
     return create_result(True, (new_status, True, updated_table))
@@ -3,11 +3,13 @@
 State management module.
 Provides functions for managing shared state between WebSocket and UI.
 """
+import asyncio
 from typing import Dict, Any
 from .data_structures import create_empty_lobby, create_lobby_status
 
 # Main data structure defined globally but only used through functions
 _lobby_state = create_empty_lobby()
+_lobby_changed = asyncio.Event()  # Set whenever the lobby state is replaced
 
 def get_lobby_state() -> Dict:
     """Get current lobby state."""
@@ -23,3 +25,11 @@ def set_lobby_state(state: Dict) -> None:
         players=tuple(state["players"]),  # Convert to tuple for immutability
         tables=tuple(state["tables"])
     )
+    _lobby_changed.set()
+
+def get_lobby_changed() -> asyncio.Event:
+    """
+    Get the event set by every set_lobby_state call.
+    Waiters clear it before reading the state, so no update is missed.
+    """
+    return _lobby_changed
@@ -3,7 +3,7 @@
 Client adapter for WebSocket communication.
 Handles connection management and message processing.
 """
-import json
+import orjson
 import asyncio
 import websockets
 from typing import Dict, Any, Callable, Tuple
@@ -27,30 +27,52 @@ def disconnect_client(client: ClientState) -> ClientState:
 
 # Message handling
 
-async def send_message(client: ClientState, msg_type: str, payload: dict) -> None:
-    """Send message to server."""
+MAX_SEND_BATCH = 128  # Queued messages sent back to back per writer wake-up
+
+def encode_message(msg_type: str, payload: dict) -> bytes:
+    """Serialize a message for the server as UTF-8 JSON."""
+    return orjson.dumps({
+        'type': msg_type,
+        'payload': payload,
+        'timestamp': datetime.now().timestamp()
+    })
+
+async def send_encoded(client: ClientState, messages: Tuple[bytes, ...]) -> None:
+    """Send already serialized messages in order, one text frame each."""
     if not client[2]:  # not connected
         raise ConnectionError("Connection is closed")
-        
+
     try:
-        message = json.dumps({
-            'type': msg_type,
-            'payload': payload,
-            'timestamp': datetime.now().timestamp()
-        })
-        await client[0].send(message)
+        for message in messages:
+            await client[0].send(message, text=True)  # orjson output is UTF-8, sent without decoding
     except websockets.exceptions.WebSocketException as e:
         raise ConnectionError(f"Failed to send message: {str(e)}")
 
+async def send_message(client: ClientState, msg_type: str, payload: dict) -> None:
+    """Send message to server."""
+    await send_encoded(client, (encode_message(msg_type, payload),))
+
+async def run_message_writer(client: ClientState, outgoing: asyncio.Queue) -> None:
+    """
+    Send queued (msg_type, payload) messages in order; runs until the task is cancelled.
+    Everything already waiting in the queue is serialized and sent as one burst.
+    """
+    while True:  # client is an immutable tuple, so its connected flag never changes here
+        batch = [await outgoing.get()]
+        while len(batch) < MAX_SEND_BATCH and not outgoing.empty():
+            batch.append(outgoing.get_nowait())
+        await send_encoded(client, tuple(encode_message(*message) for message in batch))
+
 async def handle_messages(client: ClientState, handlers: MessageHandlers) -> None:
     """Handle incoming messages from server."""
     while client[2]:  # while connected
         try:
-            message = await client[0].recv()
+            # Raw bytes: orjson checks the encoding itself, so skip the UTF-8 decode here
+            message = await client[0].recv(decode=False)
             
             try:
-                data = json.loads(message)
-            except json.JSONDecodeError as e:
+                data = orjson.loads(message)
+            except ValueError as e:  # Invalid JSON or invalid UTF-8
                 print(f"Failed to parse message: {e}")
                 continue
                 
@@ -91,7 +113,8 @@ async def connect(url: str) -> ClientState:
         websocket = await websockets.connect(
             url,
             ping_interval=20,    # Send ping every 20 seconds
-            ping_timeout=60      # Wait 60 seconds for pong response
+            ping_timeout=60,     # Wait 60 seconds for pong response
+            compression="deflate"  # Lobby JSON compresses well
         )
         return create_client_state(websocket)
     except Exception as e:
@@ -3,12 +3,11 @@
 Server adapter for WebSocket communication.
 Handles client connections and message broadcasting.
 """
-import json
+import orjson
 import asyncio
 import websockets
 from typing import Dict, Set, Any, Tuple
 from datetime import datetime
-from frozendict import frozendict
 from websockets.server import WebSocketServerProtocol
 from services.lobby_table_handler import (
     create_empty_lobby, handle_login_player,
@@ -20,20 +19,22 @@ from services.game_handler import create_initial_game_state
 ClientState = Tuple[WebSocketServerProtocol, datetime]  # (websocket, last_heartbeat)
 Server = Dict[str, Any]
 
-def serialize_lobby_status(status: Any) -> Any:
-    """Convert frozen structures and datetime to JSON-serializable types."""
-    if isinstance(status, frozendict):
-        status = dict(status)
-    elif isinstance(status, datetime):
-        return status.timestamp()
-    
-    # Handle nested structures
-    if isinstance(status, dict):
-        return {k: serialize_lobby_status(v) for k, v in status.items()}
-    if isinstance(status, (list, tuple)):
-        return [serialize_lobby_status(x) for x in status]
-    
-    return status
+def _encode_extra(value: Any) -> Any:
+    """orjson fallback: datetimes are sent as timestamps."""
+    if isinstance(value, datetime):
+        return value.timestamp()
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+def encode_message(msg_type: str, payload: dict) -> bytes:
+    """
+    Serialize a message for clients as UTF-8 JSON.
+    orjson writes frozendicts and tuples directly, so the payload is not copied first.
+    """
+    return orjson.dumps({
+        'type': msg_type,
+        'payload': payload,
+        'timestamp': datetime.now().timestamp()
+    }, default=_encode_extra, option=orjson.OPT_PASSTHROUGH_DATETIME)
 
 # Pure functions for state management
 
@@ -54,43 +55,38 @@ def create_client_state(websocket: WebSocketServerProtocol) -> ClientState:
 
 async def send_message(websocket: WebSocketServerProtocol, msg_type: str, payload: dict) -> None:
     """Send message to client."""
-    message = json.dumps({
-        'type': msg_type,
-        'payload': serialize_lobby_status(payload),
-        'timestamp': datetime.now().timestamp()
-    })
-    await websocket.send(message)
+    await websocket.send(encode_message(msg_type, payload), text=True)
 
 async def broadcast_message(server: Server, msg_type: str, payload: dict) -> None:
     """Broadcast message to all connected clients."""
     if not server['running']:
         raise RuntimeError("Server is not running")
         
-    message = json.dumps({
-        'type': msg_type,
-        'payload': serialize_lobby_status(payload),
-        'timestamp': datetime.now().timestamp()
-    })
+    message = encode_message(msg_type, payload)  # Serialized once for all clients
     
-    # Send to all connected clients
-    failed_clients = set()
-    for client in server['clients'].copy():
-        try:
-            await client[0].send(message)
-        except websockets.exceptions.WebSocketException:
-            failed_clients.add(client)
-            try:
-                await client[0].close()
-            except websockets.exceptions.WebSocketException:
-                pass
+    # Send to all connected clients concurrently, so one slow client does not delay the others
+    clients = tuple(server['clients'])  # Snapshot: the set may change while sends are pending
+    results = await asyncio.gather(
+        *(client[0].send(message, text=True) for client in clients),
+        return_exceptions=True
+    )
+    failed_clients = [
+        client for client, result in zip(clients, results)
+        if isinstance(result, websockets.exceptions.WebSocketException)
+    ]
 
-    # Remove failed clients after iteration
+    # Close and remove failed clients after all sends finished
     for client in failed_clients:
         try:
-            server['clients'].remove(client)
-        except KeyError:
-            # Client was already removed
+            await client[0].close()
+        except websockets.exceptions.WebSocketException:
             pass
+        server['clients'].discard(client)  # Client may already be removed
+
+    # Any other error is re-raised only once the dead clients are gone
+    for result in results:
+        if isinstance(result, BaseException) and not isinstance(result, websockets.exceptions.WebSocketException):
+            raise result
 
 # Server-side lobby state
 _server_lobby = create_empty_lobby()
@@ -114,10 +110,10 @@ async def broadcast_lobby_status(server: Server) -> None:
     lobby_status = get_server_lobby()
     await broadcast_message(server, 'lobby_update', lobby_status)
 
-async def handle_client_message(server: Server, client: ClientState, message: str) -> ClientState:
+async def handle_client_message(server: Server, client: ClientState, message: bytes) -> ClientState:
     """Handle incoming client message."""
     try:
-        data = json.loads(message)
+        data = orjson.loads(message)
         
         if data['type'] == 'disconnect':
             server['clients'].remove(client)
@@ -188,7 +184,7 @@ async def handle_client_message(server: Server, client: ClientState, message: st
                 await send_message(client[0], 'error', {'message': 'Table not found'})
             return client
             
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         await send_message(client[0], 'error', {'message': 'Invalid message format'})
         
     return client
@@ -204,7 +200,7 @@ async def handle_client(server: Server, websocket: WebSocketServerProtocol) -> N
     try:
         while server['running'] and client in server['clients']:
             try:
-                message = await websocket.recv()
+                message = await websocket.recv(decode=False)  # orjson parses the raw bytes
                 client = await handle_client_message(server, client, message)
             except websockets.exceptions.WebSocketException:
                 break
@@ -228,7 +224,8 @@ async def start_server(server: Server) -> None:
             'localhost',
             server['port'],
             ping_interval=20,    # Send ping every 20 seconds
-            ping_timeout=60      # Wait 60 seconds for pong response
+            ping_timeout=60,     # Wait 60 seconds for pong response
+            compression="deflate"  # Lobby JSON compresses well
         ):
             await asyncio.Future()  # run forever
     
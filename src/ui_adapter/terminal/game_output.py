@@ -6,16 +6,18 @@ from services.game_handler import (
     gameflow, initialize_game, handle_variant_phase,
     play_all_tricks, finalize_game
 )
+from .screen_output import write_lines, CLEAR_SCREEN
+
+SUIT_SYMBOLS = {
+    "hearts": "♥",
+    "diamonds": "♦",
+    "clubs": "♣",
+    "spades": "♠"
+}
 
 def format_card(card: Dict) -> str:
     """Format a card for display"""
-    suit_symbols = {
-        "hearts": "♥",
-        "diamonds": "♦",
-        "clubs": "♣",
-        "spades": "♠"
-    }
-    return f"{suit_symbols[card['suit']]}{card['rank']}"
+    return SUIT_SYMBOLS[card['suit']] + card['rank']
 
 def format_player(player: Dict) -> str:
     """Format player info for display"""
@@ -23,61 +25,59 @@ def format_player(player: Dict) -> str:
 
 def clear_screen() -> None:
     """Clear the terminal screen"""
-    print("\033[H\033[J")
+    write_lines([CLEAR_SCREEN])
 
 def display_game_state(game: Dict) -> None:
     """Display the current game state"""
-    clear_screen()
-    print("Game State:")
-    print(f"Phase: {game['phase']}")
+    lines = [CLEAR_SCREEN, "Game State:", f"Phase: {game['phase']}"]
     
     # Show current player
     current_player = next(p for p in game['players'] if p['uuid'] == game['current_player'])
-    print(f"Current Player: {format_player(current_player)}")
+    lines.append(f"Current Player: {format_player(current_player)}")
     
     # Show game mode
-    print(f"Game Mode: {game['mode']}")
+    lines.append(f"Game Mode: {game['mode']}")
     
     # Show teams if known
-    print("\nTeams:")
+    lines.append("\nTeams:")
     for player in game['players']:
         team = game['player_teams'].get(player['uuid'], 'Unknown')
-        print(f"  {format_player(player)}: {team}")
+        lines.append(f"  {format_player(player)}: {team}")
     
     # Show announcements if any
     if game['announcements']:
-        print("\nAnnouncements:")
-        for announcement in game['announcements']:
-            print(f"  - {announcement}")
-    print()
+        lines.append("\nAnnouncements:")
+        lines.extend(f"  - {announcement}" for announcement in game['announcements'])
+    lines.append("")
+    write_lines(lines)
 
 def display_player_hand(cards: List[Dict], eligible_cards: Optional[List[Dict]] = None) -> None:
     """Display a player's hand with eligible cards highlighted"""
-    print("Your Hand:")
+    # (suit, rank) keys: cards received over the socket are plain, unhashable dicts
+    eligible = {(c['suit'], c['rank']) for c in eligible_cards or ()}
+    lines = ["Your Hand:"]
     for i, card in enumerate(cards, 1):
         card_str = format_card(card)
-        if eligible_cards and card in eligible_cards:
-            print(f"  {i}. [{card_str}]")  # Highlight eligible cards
+        if (card['suit'], card['rank']) in eligible:
+            lines.append(f"  {i}. [{card_str}]")  # Highlight eligible cards
         else:
-            print(f"  {i}.  {card_str}")
+            lines.append(f"  {i}.  {card_str}")
+    write_lines(lines)
 
 def display_trick(trick: List[Dict]) -> None:
     """Display the current trick"""
-    print("\nCurrent Trick:")
     if not trick:
-        print("  (No cards played yet)")
+        write_lines(["\nCurrent Trick:", "  (No cards played yet)"])
         return
     
-    for card_info in trick:
-        player = card_info['player']
-        card = card_info['card']
-        print(f"  {format_player(player)}: {format_card(card)}")
+    write_lines(["\nCurrent Trick:"] + [
+        f"  {format_player(card_info['player'])}: {format_card(card_info['card'])}"
+        for card_info in trick
+    ])
 
 def display_scores(scores: Dict) -> None:
     """Display the current scores"""
-    print("\nScores:")
-    for team, score in scores.items():
-        print(f"  {team}: {score} points")
+    write_lines(["\nScores:"] + [f"  {team}: {score} points" for team, score in scores.items()])
 
 def get_player_input(prompt: str, valid_options: List[str]) -> str:
     """Get and validate player input"""
@@ -92,11 +92,13 @@ def handle_variant_selection(game: Dict, player_token: str) -> str:
     if game['current_player'] != player_token:
         return "pass"
     
-    print("\nVariant Selection Phase")
-    print("Available variants:")
-    print("1. Normal")
-    print("2. Solo")
-    print("3. Pass")
+    write_lines([
+        "\nVariant Selection Phase",
+        "Available variants:",
+        "1. Normal",
+        "2. Solo",
+        "3. Pass"
+    ])
     
     choice = get_player_input(
         "Select variant",
@@ -157,7 +159,6 @@ def run_game_interface(table: Dict, player_token: str) -> NoReturn:
         input("\nPress Enter to continue...")
     
     # Show final scores
-    clear_screen()
-    print("Game Complete!")
+    write_lines([CLEAR_SCREEN, "Game Complete!"])
     display_scores(game['final_score'])
     input("\nPress Enter to return to lobby...")
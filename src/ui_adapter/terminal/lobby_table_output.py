@@ -1,283 +1,399 @@
 # src/ui-adapter/terminal/lobby_table_output.py
 
 from typing import Tuple, Optional, List, NoReturn, Dict, Any
-from services.lobby_table_handler import create_table, add_player_to_table, start_table, create_empty_lobby
-from services.data_structures import create_player, create_table, create_lobby_status
-from .game_output import run_game_interface
+from services.lobby_table_handler import create_empty_lobby
+from services.state import get_lobby_state, get_lobby_changed
+from socket_adapter.client_adapter import send_message
+from .screen_output import write_lines, CLEAR_SCREEN
 import asyncio
 import logging
+import os
+import sys
+import threading
 
 logger = logging.getLogger('client.ui')
 
-def _format_player(player: Dict[str, Any]) -> str:
-    """Format player info for display"""
-    if not isinstance(player, dict) or "name" not in player:
-        return "Invalid player"
-    return player["name"]
+COMMAND_PROMPT = "\nEnter command: "
+INTERACTIVE = sys.stdin.isatty() and sys.stdout.isatty()  # False when piped (tests, scripts)
+# Pauses only make sense for a person at a terminal; DK_NO_PAUSE=1 also skips them (profiling)
+PAUSE_ENABLED = INTERACTIVE and os.environ.get("DK_NO_PAUSE") != "1"
+_SCREEN_START = [CLEAR_SCREEN] if INTERACTIVE else []  # No clear sequence in piped output
 
-def _clear_screen() -> None:
-    """Clear the terminal screen using ANSI escape codes"""
-    print("\033[H\033[J")
+# Main data structure defined globally but only used through functions
+_last_frame: Tuple[Optional[Dict], Optional[str], List[str]] = (None, None, [])  # (state, token, lines) last shown
+_stdin_lines: Optional[asyncio.Queue] = None  # Lines read by the stdin reader thread, once started
 
-def _display_menu(token: Optional[str]) -> None:
-    """Display the appropriate menu based on connection state"""
-    print("\nAvailable actions:")
-    if not token:
-        print("  5 [name]                - Connect player (e.g., \"5 john\")")
-    else:
-        print("  1 [table_name] [rounds] - Create new table (e.g., \"1 mytable 3\")")
-        print("  2 [table_name]          - Join table (e.g., \"2 mytable\")")
-        print("  3 [table_name]          - Start table (e.g., \"3 mytable\")")
-        print("  4                       - Exit")
-        print("  6                       - Refresh lobby status")
+# Menus never change, so they are built once
+_MENU_DISCONNECTED = (
+    "\nAvailable actions:",
+    "  5 [name]                - Connect player (e.g., \"5 john\")"
+)
+_MENU_CONNECTED = (
+    "\nAvailable actions:",
+    "  1 [table_name] [rounds] - Create new table (e.g., \"1 mytable 3\")",
+    "  2 [table_name]          - Join table (e.g., \"2 mytable\")",
+    "  3 [table_name]          - Start table (e.g., \"3 mytable\")",
+    "  4                       - Exit",
+    "  6                       - Refresh lobby status"
+)
+
+def _format_menu(token: Optional[str]) -> Tuple[str, ...]:
+    """Get the appropriate menu based on connection state"""
+    return _MENU_CONNECTED if token else _MENU_DISCONNECTED
+
+def _read_stdin(loop: asyncio.AbstractEventLoop, lines: asyncio.Queue) -> None:
+    """Stdin reader thread: hand each line to the event loop, then None at end of input"""
+    try:
+        for line in sys.stdin:
+            loop.call_soon_threadsafe(lines.put_nowait, line.rstrip("\n"))
+        loop.call_soon_threadsafe(lines.put_nowait, None)
+    except RuntimeError:  # Event loop already closed
+        pass
+
+async def _prompt(text: str) -> str:
+    """
+    Read a line from the terminal without blocking the event loop.
+    Lines come from a daemon reader thread, so waiting here can be cancelled (e.g. by Ctrl+C)
+    and a pending read never keeps the process alive. Raises EOFError at end of input, like input().
+    """
+    global _stdin_lines
+    if _stdin_lines is None:
+        _stdin_lines = asyncio.Queue()
+        threading.Thread(
+            target=_read_stdin,
+            args=(asyncio.get_running_loop(), _stdin_lines),
+            name="stdin-reader",
+            daemon=True
+        ).start()
+    write_lines([text], end="")
+    line = await _stdin_lines.get()
+    if line is None:
+        _stdin_lines.put_nowait(None)  # Later prompts see the end of input too
+        raise EOFError
+    return line
+
+async def _pause() -> None:
+    """Wait for Enter after a message, unless pauses are disabled"""
+    if PAUSE_ENABLED:
+        await _prompt("Press Enter to continue...")
 
-def _get_user_input(token: Optional[str]) -> Tuple[str, str, Optional[str]]:
+async def _get_user_input(token: Optional[str]) -> Tuple[str, str, Optional[str]]:
     """Get and parse user input"""
-    user_input = input("\nEnter command: ").strip().lower()
-    parts = user_input.split()
-    
-    if not parts:  # Handle empty input
+    user_input = (await _prompt(COMMAND_PROMPT)).strip().lower()
+    if not user_input:  # Handle empty input
         return "", "", token
     
-    command = parts[0]
-    args = " ".join(parts[1:]) if len(parts) > 1 else ""
+    # Command is the first word, args the rest of the line as typed
+    command, *rest = user_input.split(maxsplit=1)
+    args = rest[0] if rest else ""
     
     # Keep the token unless explicitly logging out
     return command, args, token
 
-def _output_lobby(lobby_state: Dict) -> None:
+def _index_players(lobby_state: Dict) -> Dict[str, Dict]:
+    """Index the lobby's valid players by uuid"""
+    return {
+        p["uuid"]: p for p in lobby_state["players"]
+        if isinstance(p, dict) and "uuid" in p and "name" in p
+    }
+
+def _format_lobby(lobby_state: Dict, players_by_uuid: Dict[str, Dict]) -> List[str]:
     """
-    Output all players in the lobby and tables with their players
+    Format all players in the lobby and tables with their players
     """
-    print("Lobby:")
-    print("  Players:")
+    # Players are listed as sent; players_by_uuid is only used for the table lookups below
+    lines = ["Lobby:", "  Players:"]
     for player in lobby_state["players"]:
-        if isinstance(player, dict) and all(k in player for k in ["name", "uuid"]):
-            print(f"    - {_format_player(player)}")
+        if isinstance(player, dict) and "uuid" in player and "name" in player:
+            lines.append(f"    - {player['name']}")
         else:
             logger.warning(f"Skipping invalid player object: {player}")
     
-    print("  Tables:")
+    lines.append("  Tables:")
+    append_line = lines.append  # Bound once for the table loop
     for table in lobby_state.get("tables", []):
         if not isinstance(table, dict) or "tablename" not in table or "players" not in table:
             logger.warning(f"Skipping invalid table object: {table}")
             continue
             
-        player_names = []
-        for player_token in table["players"]:
-            player = next((p for p in lobby_state["players"] 
-                         if isinstance(p, dict) and 
-                         p.get("uuid") == player_token and
-                         "name" in p), None)
-            if player:
-                player_names.append(_format_player(player))
-            else:
-                player_names.append(f"Unknown({player_token})")
-        
-        print(f"    - {table['tablename']} (Players: {', '.join(player_names) if player_names else 'None'})")
+        player_names = [
+            players_by_uuid[player_token]["name"] if player_token in players_by_uuid else f"Unknown({player_token})"
+            for player_token in table["players"]
+        ]
+        append_line(f"    - {table['tablename']} (Players: {', '.join(player_names) if player_names else 'None'})")
+    return lines
+
+def _format_table(table: Dict[str, Any]) -> List[str]:
+    """Format table information"""
+    return [
+        "Table:",
+        f"  - Name: {table['tablename']}",
+        f"  - Players: {', '.join(table['players']) if table['players'] else 'None'}"
+    ]
+
+def _format_screen(lobby_state: Dict, token: Optional[str]) -> List[str]:
+    """Format the whole screen: clear, lobby, connected player and menu"""
+    players_by_uuid = _index_players(lobby_state)  # Shared by all lookups of this frame
+    lines = _SCREEN_START + _format_lobby(lobby_state, players_by_uuid)
+    
+    if token:
+        player = players_by_uuid.get(token)
+        if player:
+            lines.append(f"\nConnected as: {player['name']}")
+    
+    lines.extend(_format_menu(token))
+    return lines
 
-def _output_table(table: Dict[str, Any]) -> None:
-    """Output table information"""
-    print("Table:")
-    print(f"  - Name: {table['tablename']}")
-    print(f"  - Players: {', '.join(table['players']) if table['players'] else 'None'}")
+def _get_screen(lobby_state: Dict, token: Optional[str]) -> List[str]:
+    """Get the screen lines, reusing the last frame if lobby state and token are unchanged"""
+    global _last_frame
+    last_state, last_token, lines = _last_frame
+    if last_state is not lobby_state or last_token != token:
+        lines = _format_screen(lobby_state, token)
+        _last_frame = (lobby_state, token, lines)
+    return lines
 
-def _render_screen(lobby_state: Dict, token: Optional[str] = None) -> Tuple[str, str, Optional[str]]:
+async def _render_screen(lobby_state: Dict, token: Optional[str] = None) -> Tuple[str, str, Optional[str], Dict]:
     """
     Render the current screen and get user input.
+    While waiting for input, the screen is redrawn whenever the lobby state changes.
     
     Args:
         lobby_state: Current lobby state
         token: Optional current player's token
         
     Returns:
-        tuple: (command, args, token) where:
-            - command is the numeric choice (1-5)
+        tuple: (command, args, token, lobby_state) where:
+            - command is the numeric choice (1-6)
             - args is any additional arguments (table name, player name)
             - token is the player's token (None if not connected)
+            - lobby_state is the lobby state on screen when the command was entered
     """
-    _clear_screen()
-    _output_lobby(lobby_state)
+    write_lines(_get_screen(lobby_state, token))
+    reader = asyncio.ensure_future(_get_user_input(token))
+    changed = get_lobby_changed()
+    try:
+        while not reader.done():
+            changed.clear()  # Cleared before reading the state, so a later update wakes us
+            latest = get_lobby_state()
+            if latest is not lobby_state:
+                lobby_state = latest
+                write_lines(_get_screen(lobby_state, token), end="\n" + COMMAND_PROMPT)
+            # Sleep until the input arrives or the lobby changes; no timed polling
+            waiter = asyncio.ensure_future(changed.wait())
+            try:
+                await asyncio.wait((reader, waiter), return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                waiter.cancel()
+    finally:
+        reader.cancel()  # No-op once the input was read; stops the read if we are cancelled
+    return (*reader.result(), lobby_state)
+
+def _index_tables(lobby_state: Dict) -> Dict[str, Dict]:
+    """Index the lobby's tables by lowercase name for case-insensitive lookup"""
+    return {t["tablename"].lower(): t for t in lobby_state["tables"]}
+
+# Command handlers
+# Each takes (args, token, state, websocket_client, tables_by_name)
+# and returns (should_exit, new_token, new_state)
+
+async def _connect_player(
+    args: str, token: Optional[str], state: Dict, websocket_client: Any, tables_by_name: Dict[str, Dict]
+) -> Tuple[bool, Optional[str], Dict]:
+    """Command 5: connect a player by name"""
+    if not args:
+        print("\nError: Player name required")
+        print("Usage: 5 <name>")
+        print("Example: 5 john")
+        return False, token, state
+
+    # Find player in lobby state
+    for player in state["players"]:
+        if isinstance(player, dict) and player["name"] == args:
+            print("\nError: Player name already exists")
+            await _pause()
+            return False, token, state
     
-    if token:
-        player = next((p for p in lobby_state["players"] if isinstance(p, dict) and p["uuid"] == token), None)
-        if player:
-            print(f"\nConnected as: {_format_player(player)}")
+    await send_message(websocket_client, 'player_connect', {'name': args, 'type': 'player'})
+    print("\nConnecting...")
+    # Wait a moment for the connection response and lobby update
+    await asyncio.sleep(0.5)
+    # Wait for server response to get player data
+    await asyncio.sleep(0.5)
+    # Get updated state which should include the new player
+    new_state = get_lobby_state()
+    # Find player to get token
+    player = next((p for p in new_state["players"] 
+                 if isinstance(p, dict) and 
+                 p.get("name") == args and 
+                 "uuid" in p), None)
+    if player:
+        token = player["uuid"]
+    else:
+        print("\nError: Failed to get player token")
+        await _pause()
+    return False, token, new_state
+
+async def _create_table(
+    args: str, token: Optional[str], state: Dict, websocket_client: Any, tables_by_name: Dict[str, Dict]
+) -> Tuple[bool, Optional[str], Dict]:
+    """Command 1: create a table with a number of rounds"""
+    parts = args.split()
+    try:
+        if len(parts) < 2:
+            print("\nError: Both table name and number of rounds are required")
+            print("Usage: 1 <table_name> <rounds>")
+            print("Example: 1 mytable 3")
+        else:
+            table_name = parts[0]
+            rounds = int(parts[1])
+            if rounds <= 0:
+                print("\nError: Number of rounds must be positive")
+            else:
+                await send_message(websocket_client, 'create_table', {
+                    'name': table_name,
+                    'rounds': rounds
+                })
+                print("\nCreating table...")
+                # Wait for server to process and update state
+                await asyncio.sleep(0.5)
+                # Get fresh state after table creation
+                new_state = get_lobby_state()
+                return False, token, new_state
+    except ValueError:
+        print("\nError: Number of rounds must be a valid positive number")
+        print("Example: 1 mytable 3")
+    # Wait a moment for the server to process and broadcast
+    await asyncio.sleep(0.5)
+    await _pause()
+    return False, token, state
+
+async def _join_table(
+    args: str, token: Optional[str], state: Dict, websocket_client: Any, tables_by_name: Dict[str, Dict]
+) -> Tuple[bool, Optional[str], Dict]:
+    """Command 2: join a table by name"""
+    if not args:
+        print("\nError: Table name required")
+    else:
+        table = tables_by_name.get(args)  # args is lowercased by _get_user_input
+        if table:
+            await send_message(websocket_client, 'join_table', {
+                'table_name': table["tablename"],
+                'player_token': token
+            })
+            print("\nJoining table...")
+            # Wait for server to process and update state
+            await asyncio.sleep(0.5)
+            # Get fresh state after joining table
+            new_state = get_lobby_state()
+            return False, token, new_state
+        else:
+            print(f"\nError: Table '{args}' not found")
+    # Wait a moment for the server to process and broadcast
+    await asyncio.sleep(0.5)
+    await _pause()
+    return False, token, state
+
+async def _start_table(
+    args: str, token: Optional[str], state: Dict, websocket_client: Any, tables_by_name: Dict[str, Dict]
+) -> Tuple[bool, Optional[str], Dict]:
+    """Command 3: start a table by name"""
+    if not args:
+        print("\nError: Table name required")
+    else:
+        table = tables_by_name.get(args)  # args is lowercased by _get_user_input
+        if table:
+            await send_message(websocket_client, 'start_table', {
+                'table_name': table["tablename"]
+            })
+            print("\nStarting table...")
+            # Wait for server to process and update state
+            await asyncio.sleep(0.5)
+            # Get fresh state after starting table
+            new_state = get_lobby_state()
+            return False, token, new_state
+        else:
+            print(f"\nError: Table '{args}' not found")
+    # Wait a moment for the server to process and broadcast
+    await asyncio.sleep(0.5)
+    await _pause()
+    return False, token, state
+
+async def _exit(
+    args: str, token: Optional[str], state: Dict, websocket_client: Any, tables_by_name: Dict[str, Dict]
+) -> Tuple[bool, Optional[str], Dict]:
+    """Command 4: leave the terminal UI"""
+    print("\nGoodbye!")
+    return True, token, state
+
+async def _refresh_lobby(
+    args: str, token: Optional[str], state: Dict, websocket_client: Any, tables_by_name: Dict[str, Dict]
+) -> Tuple[bool, Optional[str], Dict]:
+    """Command 6: request a fresh lobby status"""
+    # Send refresh request
+    await send_message(websocket_client, 'get_lobby_status', {})
+    print("\nRefreshing lobby status...")
+    
+    # Wait for server response and state update
+    await asyncio.sleep(0.5)
     
-    _display_menu(token)
-    return _get_user_input(token)
+    # Get fresh state after update
+    new_state = get_lobby_state()
+    
+    await _pause()
+    return False, token, new_state  # Return new state instead of old state
+
+async def _invalid_command(
+    args: str, token: Optional[str], state: Dict, websocket_client: Any, tables_by_name: Dict[str, Dict]
+) -> Tuple[bool, Optional[str], Dict]:
+    """Unknown command, or a command that needs a connected player"""
+    if not token:
+        print("\nError: Please connect first (option 5)")
+    else:
+        print("\nError: Invalid command")
+    await _pause()
+    return False, token, state
+
+# command -> (handler, requires a connected player)
+_COMMANDS = {
+    "1": (_create_table, True),
+    "2": (_join_table, True),
+    "3": (_start_table, True),
+    "4": (_exit, False),
+    "5": (_connect_player, False),
+    "6": (_refresh_lobby, True)
+}
 
 async def _handle_command(
     command: str,
     args: str,
     token: Optional[str],
     state: Dict,
-    websocket_client: Any
+    websocket_client: Any,
+    tables_by_name: Dict[str, Dict]
 ) -> Tuple[bool, Optional[str], Dict]:
     """
     Handle a single command and return whether to exit and the new token state.
     
     Args:
-        command: The command to execute (1-5)
+        command: The command to execute (1-6)
         args: Additional arguments for the command
         token: Current player token
         state: Current lobby state
         websocket_client: WebSocket client instance
+        tables_by_name: Tables of state, indexed by _index_tables
         
     Returns:
         tuple: (should_exit, new_token, new_state)
     """
+    handler, requires_token = _COMMANDS.get(command, (_invalid_command, False))
+    if requires_token and not token:
+        handler = _invalid_command
     try:
-        if command == "5":  # Connect player
-            if not args:
-                print("\nError: Player name required")
-                print("Usage: 5 <name>")
-                print("Example: 5 john")
-            else:
-                # Find player in lobby state
-                for player in state["players"]:
-                    if isinstance(player, dict) and player["name"] == args:
-                        print("\nError: Player name already exists")
-                        input("Press Enter to continue...")
-                        return False, token, state
-                
-                from socket_adapter.client_adapter import send_message
-                await send_message(websocket_client, 'player_connect', {'name': args, 'type': 'player'})
-                print("\nConnecting...")
-                # Wait a moment for the connection response and lobby update
-                await asyncio.sleep(0.5)
-                # Wait for server response to get player data
-                await asyncio.sleep(0.5)
-                # Get updated state which should include the new player
-                from services.state import get_lobby_state
-                new_state = get_lobby_state()
-                # Find player to get token
-                player = next((p for p in new_state["players"] 
-                             if isinstance(p, dict) and 
-                             p.get("name") == args and 
-                             "uuid" in p), None)
-                if player:
-                    token = player["uuid"]
-                else:
-                    print("\nError: Failed to get player token")
-                    input("Press Enter to continue...")
-                return False, token, new_state
-            return False, token, state
-        
-        elif command == "1" and token:  # Create table
-            parts = args.split()
-            try:
-                if len(parts) < 2:
-                    print("\nError: Both table name and number of rounds are required")
-                    print("Usage: 1 <table_name> <rounds>")
-                    print("Example: 1 mytable 3")
-                else:
-                    table_name = parts[0]
-                    rounds = int(parts[1])
-                    if rounds <= 0:
-                        print("\nError: Number of rounds must be positive")
-                    else:
-                        from socket_adapter.client_adapter import send_message
-                        await send_message(websocket_client, 'create_table', {
-                            'name': table_name,
-                            'rounds': rounds
-                        })
-                        print("\nCreating table...")
-                        # Wait for server to process and update state
-                        await asyncio.sleep(0.5)
-                        # Get fresh state after table creation
-                        from services.state import get_lobby_state
-                        new_state = get_lobby_state()
-                        return False, token, new_state
-            except ValueError:
-                print("\nError: Number of rounds must be a valid positive number")
-                print("Example: 1 mytable 3")
-            # Wait a moment for the server to process and broadcast
-            await asyncio.sleep(0.5)
-            input("Press Enter to continue...")
-            return False, token, state
-        
-        elif command == "2" and token:  # Join table
-            if not args:
-                print("\nError: Table name required")
-            else:
-                table = next((t for t in state["tables"] if t["tablename"].lower() == args.lower()), None)
-                if table:
-                    from socket_adapter.client_adapter import send_message
-                    await send_message(websocket_client, 'join_table', {
-                        'table_name': table["tablename"],
-                        'player_token': token
-                    })
-                    print("\nJoining table...")
-                    # Wait for server to process and update state
-                    await asyncio.sleep(0.5)
-                    # Get fresh state after joining table
-                    from services.state import get_lobby_state
-                    new_state = get_lobby_state()
-                    return False, token, new_state
-                else:
-                    print(f"\nError: Table '{args}' not found")
-            # Wait a moment for the server to process and broadcast
-            await asyncio.sleep(0.5)
-            input("Press Enter to continue...")
-            return False, token, state
-        
-        elif command == "3" and token:  # Start table
-            if not args:
-                print("\nError: Table name required")
-            else:
-                table = next((t for t in state["tables"] if t["tablename"].lower() == args.lower()), None)
-                if table:
-                    from socket_adapter.client_adapter import send_message
-                    await send_message(websocket_client, 'start_table', {
-                        'table_name': table["tablename"]
-                    })
-                    print("\nStarting table...")
-                    # Wait for server to process and update state
-                    await asyncio.sleep(0.5)
-                    # Get fresh state after starting table
-                    from services.state import get_lobby_state
-                    new_state = get_lobby_state()
-                    return False, token, new_state
-                else:
-                    print(f"\nError: Table '{args}' not found")
-            # Wait a moment for the server to process and broadcast
-            await asyncio.sleep(0.5)
-            input("Press Enter to continue...")
-            return False, token, state
-        
-        elif command == "4":  # Exit
-            print("\nGoodbye!")
-            return True, token, state
-            
-        elif command == "6" and token:  # Refresh lobby status
-            from socket_adapter.client_adapter import send_message
-            from services.state import get_lobby_state
-            
-            # Send refresh request
-            await send_message(websocket_client, 'get_lobby_status', {})
-            print("\nRefreshing lobby status...")
-            
-            # Wait for server response and state update
-            await asyncio.sleep(0.5)
-            
-            # Get fresh state after update
-            new_state = get_lobby_state()
-            
-            input("Press Enter to continue...")
-            return False, token, new_state  # Return new state instead of old state
-        
-        else:
-            if not token and command != "5":
-                print("\nError: Please connect first (option 5)")
-            else:
-                print("\nError: Invalid command")
-            input("Press Enter to continue...")
-            return False, token, state
-            
+        return await handler(args, token, state, websocket_client, tables_by_name)
     except Exception as e:
         print(f"\nError: {str(e)}")
-        input("Press Enter to continue...")
+        await _pause()
         return False, token, state
 
 async def run_terminal_ui_adapter(websocket_client: Any, initial_token: Optional[str] = None) -> NoReturn:
@@ -291,14 +407,21 @@ async def run_terminal_ui_adapter(websocket_client: Any, initial_token: Optional
     """
     state = create_empty_lobby()  # Local state
     token = initial_token
+    tables_by_name = _index_tables(state)
     
     while True:
         # Get user input
-        command, args, token = _render_screen(state, token)
+        command, args, token, shown_state = await _render_screen(state, token)
+        if shown_state is not state:  # Lobby was refreshed while waiting for input
+            state = shown_state
+            tables_by_name = _index_tables(state)
         
         # Handle command and get new state
-        should_exit, token, state = await _handle_command(
-            command, args, token, state, websocket_client
+        should_exit, token, new_state = await _handle_command(
+            command, args, token, state, websocket_client, tables_by_name
         )
+        if new_state is not state:  # Re-index only when the lobby changed
+            state = new_state
+            tables_by_name = _index_tables(state)
         if should_exit:
             break
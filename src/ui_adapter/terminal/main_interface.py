@@ -14,10 +14,8 @@ Any implementation should use standalone functions, not classes.
 """
 
 from typing import Dict, List, Tuple, Optional, NoReturn
-from .lobby_table_output import run_terminal_frontend
+from .lobby_table_output import run_terminal_ui_adapter
 from .game_output import run_game_interface
-from services.data_structures import TableType, PlayerType
-from services.lobby_table_handler import get_lobby_status
 
 def handle_setup() -> None:
     """
@@ -0,0 +1,12 @@
+# src/ui-adapter/terminal/screen_output.py
+# Shared stdout helpers for the terminal UIs; imports nothing from the game services.
+
+import sys
+from typing import List
+
+CLEAR_SCREEN = "\033[H\033[J"  # ANSI: cursor home, clear to end of screen
+
+def write_lines(lines: List[str], end: str = "\n") -> None:
+    """Write lines to the terminal with one write and one flush"""
+    sys.stdout.write("\n".join(lines) + end)
+    sys.stdout.flush()
@@ -0,0 +1,26 @@
+import json
+import pytest
+from src import config
+
+@pytest.fixture(autouse=True)
+def config_path(tmp_path, monkeypatch):
+    path = tmp_path / "config.json"
+    monkeypatch.setattr(config, "CONFIG_PATH", path)
+    return path
+
+def test_read_config_default_without_file():
+    assert config.get_server_config()["host"] == "localhost"
+    with pytest.raises(TypeError):
+        config.get_server_config()["host"] = "example.org"  # Shared default is frozen
+
+def test_read_config_cached_until_file_changes(config_path):
+    config_path.write_text(json.dumps({"server": {"port": 1}, "client": {"port": 1}}))
+    first = config.read_config()
+    assert config.read_config() is first  # Unchanged file is not parsed again
+    with pytest.raises(TypeError):
+        first["server"]["port"] = 3  # Cached config is frozen
+
+    config.update_server_config({"port": 2})
+    assert config.get_server_config() == {"port": 2}
+    assert first["server"] == {"port": 1}  # Update does not mutate the cached dict
+    assert json.loads(config_path.read_text())["server"] == {"port": 2}
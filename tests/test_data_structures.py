@@ -1,6 +1,7 @@
 import pytest
 from datetime import datetime
 from src.services.data_structures import (
+    create_empty_lobby,
     create_player,
     create_card,
     create_announcement,
@@ -20,6 +21,16 @@ def test_create_card_immutable():
     with pytest.raises(TypeError):
         card["value"] = 10  # Should fail - frozendict is immutable
 
+def test_create_card_hashable():
+    card = create_card("hearts", "ace", 11, True)
+    same = create_card("hearts", "ace", 11, True)
+    assert hash(card) == hash(same)
+    assert len({card, same}) == 1  # Equal cards collapse in a set
+
+def test_create_card_shared():
+    card = create_card("clubs", "queen", 3, True)
+    assert card is create_card("clubs", "queen", 3, True)  # Memoized
+
 def test_create_announcement_immutable():
     now = datetime.now()
     announcement = create_announcement("player1", "re", 0, now)
@@ -41,6 +52,12 @@ def test_create_lobby_status_immutable():
     with pytest.raises(TypeError):
         lobby["players"] = (create_player("s1", "John", "human", "u1"),)  # Should fail
 
+def test_create_empty_lobby_shared():
+    lobby = create_empty_lobby()
+    assert lobby is create_empty_lobby()  # Immutable, so safe to share
+    with pytest.raises(TypeError):
+        lobby["players"] = ()
+
 def test_player_type_validation():
     # Valid player type
     player = create_player("session1", "John", PLAYER_TYPES[0], "uuid1")
@@ -1,6 +1,11 @@
 import pytest
+import random
+from collections import Counter
 from datetime import datetime
-from src.services.game_handler import gameflow, create_initial_game_state, initialize_game
+from src.services.game_handler import (
+    gameflow, create_initial_game_state, initialize_game, assign_teams,
+    create_cards, distribute_cards, deal_cards
+)
 from src.services.data_structures import create_player, create_table
 
 def test_gameflow_initialization():
@@ -30,6 +35,7 @@ def test_gameflow_initialization():
     assert game["mode"] in ["normal", "solo", "armut"]
     assert game["start_time"] is not None
     assert game["end_time"] is not None
+    assert datetime.fromisoformat(game["end_time"]) >= datetime.fromisoformat(game["start_time"])
     assert game["players"] == players
     
     # Verify card distribution
@@ -69,6 +75,39 @@ def test_game_initialization():
         assert len(game["cards"][player_uuid]) == 10  # Each player should have 10 cards
     assert game["current_player"] in [p["uuid"] for p in players]
 
+def test_distribute_cards_deals_disjoint_hands():
+    """Test that every card of the deck is dealt to exactly one player"""
+    players = (
+        create_player("s1", "Player1", "human", "uuid1"),
+        create_player("s2", "Player2", "human", "uuid2"),
+        create_player("s3", "Player3", "human", "uuid3"),
+        create_player("s4", "Player4", "human", "uuid4")
+    )
+    
+    # Deal by position so equal cards at different positions stay distinct
+    positions = tuple(range(len(create_cards())))
+    hands = distribute_cards(positions, players)
+    
+    assert all(len(hand) == 10 for hand in hands.values())
+    assert sorted(sum(hands.values(), ())) == list(positions)
+    
+    # Fewer cards than players: everyone gets an empty hand
+    assert distribute_cards(positions[:2], players) == dict.fromkeys(("uuid1", "uuid2", "uuid3", "uuid4"), ())
+
+def test_deal_cards_deals_whole_deck():
+    """Test that dealing hands out exactly the cards of one deck"""
+    players = (
+        create_player("s1", "Player1", "human", "uuid1"),
+        create_player("s2", "Player2", "human", "uuid2"),
+        create_player("s3", "Player3", "human", "uuid3"),
+        create_player("s4", "Player4", "human", "uuid4")
+    )
+    
+    hands = deal_cards(players, random.Random(3))
+    
+    assert all(len(hand) == 10 for hand in hands.values())
+    assert Counter(sum(hands.values(), ())) == Counter(create_cards())
+
 def test_gameflow_table_status_update():
     """Test that table status is updated correctly based on num_rounds"""
     players = (
@@ -105,3 +144,48 @@ def test_gameflow_team_assignments():
     assert len(game["player_teams"]) == 4
     for team in game["player_teams"].values():
         assert team in ["re", "kontra"]  # No unknown teams at end of game
+
+def test_assign_teams_with_seeded_rng():
+    """Test that a seeded random source gives reproducible team assignments"""
+    players = (
+        create_player("s1", "Player1", "human", "uuid1"),
+        create_player("s2", "Player2", "human", "uuid2"),
+        create_player("s3", "Player3", "human", "uuid3"),
+        create_player("s4", "Player4", "human", "uuid4")
+    )
+    
+    teams = assign_teams(players, random.Random(42))
+    assert teams == assign_teams(players, random.Random(42))
+    assert sorted(teams.values()) == ["kontra", "kontra", "re", "re"]
+
+def test_gameflow_with_seeded_rng():
+    """Test that a seeded random source makes a whole round reproducible"""
+    players = (
+        create_player("s1", "Player1", "human", "uuid1"),
+        create_player("s2", "Player2", "human", "uuid2"),
+        create_player("s3", "Player3", "human", "uuid3"),
+        create_player("s4", "Player4", "human", "uuid4")
+    )
+    
+    table = create_table("Test Table", players, (), "waiting")
+    first = gameflow(table, random.Random(7))["rounds"][0]
+    second = gameflow(table, random.Random(7))["rounds"][0]
+    
+    assert first["tricks"] == second["tricks"]
+    assert first["player_teams"] == second["player_teams"]
+
+def test_gameflow_reports_state_to_log():
+    """Test that gameflow calls log after each trick and when the round is complete"""
+    players = (
+        create_player("s1", "Player1", "human", "uuid1"),
+        create_player("s2", "Player2", "human", "uuid2"),
+        create_player("s3", "Player3", "human", "uuid3"),
+        create_player("s4", "Player4", "human", "uuid4")
+    )
+    
+    table = create_table("Test Table", players, (), "waiting")
+    states = []
+    game = gameflow(table, random.Random(7), lambda state: states.append({**state}))["rounds"][0]
+    
+    assert [len(s["tricks"]) for s in states] == list(range(1, 11)) + [10]
+    assert states[-1] == game
@@ -0,0 +1,58 @@
+import pytest
+from datetime import datetime
+from src.services import game_logger
+from src.services.game_logger import (
+    log_game_state,
+    flush_logs,
+    get_game_logs,
+    load_game_log
+)
+
+@pytest.fixture(autouse=True)
+def logs_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(game_logger, "LOGS_DIR", tmp_path / "logs")
+    yield tmp_path / "logs"
+    flush_logs()
+
+def test_log_game_state_written_after_flush(logs_dir):
+    assert get_game_logs("g1") == ()
+    game = {"phase": "playing", "tricks": ()}
+    log_game_state("g1", game)
+    game["phase"] = "finished"  # Later updates do not leak into the queued record
+
+    flush_logs()
+    (log_file,) = get_game_logs("g1")
+    assert log_file.parent == logs_dir and log_file.name.endswith("_game_g1.jsonl")
+    assert load_game_log(log_file) == ({"phase": "playing", "tricks": []},)
+
+def test_log_game_state_writes_one_file_per_game(logs_dir):
+    for turn in range(100):
+        log_game_state("g1" if turn % 2 else "g2", {"turn": turn})
+
+    flush_logs()
+    assert len(get_game_logs()) == 2
+    records = load_game_log(get_game_logs("g1")[0])
+    assert [r["turn"] for r in records] == list(range(1, 100, 2))
+
+def test_log_game_state_serializes_datetime(logs_dir):
+    start = datetime(2024, 1, 1, 12, 30)
+    log_game_state("g1", {"start_time": start})
+    flush_logs()
+    assert load_game_log(get_game_logs("g1")[0])[0]["start_time"] == start.isoformat()
+
+def test_log_game_state_writes_int_keyed_tricks(logs_dir):
+    log_game_state("g1", {"tricks": {0: ()}})
+    flush_logs()
+    assert load_game_log(get_game_logs("g1")[0]) == ({"tricks": {"0": []}},)
+
+def test_failed_write_does_not_stop_logger(logs_dir, monkeypatch):
+    blocker = logs_dir.parent / "not_a_dir"
+    blocker.write_text("")
+    monkeypatch.setattr(game_logger, "LOGS_DIR", blocker / "logs")
+    log_game_state("g1", {"turn": 0})
+    flush_logs()  # Returns although the write failed
+
+    monkeypatch.setattr(game_logger, "LOGS_DIR", logs_dir)
+    log_game_state("g2", {"turn": 1})
+    flush_logs()
+    assert load_game_log(get_game_logs("g2")[0]) == ({"turn": 1},)
@@ -56,3 +56,4 @@ def test_lobby_table_creation():
     assert result[0], f"Failed to add player to table: {result[2]}"
     lobby_state, table = result[1]
     assert player2["name"] in table["players"]
+    assert lobby_state["tables"] == (table,)  # Replaces the old table entry
@@ -0,0 +1,75 @@
+import asyncio
+import sys
+from pathlib import Path
+import pytest
+
+# The UI modules import the services as top-level packages, like the client does
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+from ui_adapter.terminal import lobby_table_output as ui
+
+PLAYERS = (
+    {"uuid": "u1", "name": "anna"},
+    {"uuid": "u2", "name": "bob"}
+)
+
+@pytest.fixture(autouse=True)
+def no_pause(monkeypatch):
+    monkeypatch.setattr(ui, "PAUSE_ENABLED", False)
+
+def read_command(monkeypatch, text, token="tok"):
+    async def prompt(_):
+        return text
+    monkeypatch.setattr(ui, "_prompt", prompt)
+    return asyncio.run(ui._get_user_input(token))
+
+def test_get_user_input_splits_command_and_args(monkeypatch):
+    """Test that the first word is the command and the rest of the line its args"""
+    assert read_command(monkeypatch, "  5   Anna  Maria ") == ("5", "anna  maria", "tok")
+    assert read_command(monkeypatch, "5\tbob") == ("5", "bob", "tok")
+    assert read_command(monkeypatch, "4") == ("4", "", "tok")
+    assert read_command(monkeypatch, "   ", None) == ("", "", None)
+
+def test_handle_command_requires_token(capsys):
+    """Test that commands needing a connected player are refused without a token"""
+    state = {"players": PLAYERS, "tables": ()}
+    result = asyncio.run(ui._handle_command("1", "mytable 3", None, state, None, {}))
+
+    assert result == (False, None, state)
+    assert "Please connect first" in capsys.readouterr().out
+
+def test_handle_command_unknown_command(capsys):
+    """Test that an unknown command leaves token and state unchanged"""
+    state = {"players": PLAYERS, "tables": ()}
+    result = asyncio.run(ui._handle_command("9", "", "u1", state, None, {}))
+
+    assert result == (False, "u1", state)
+    assert "Invalid command" in capsys.readouterr().out
+
+def test_format_lobby_lists_players_and_tables():
+    """Test lobby lines, including unknown table players, duplicate uuids and malformed entries"""
+    state = {
+        "players": PLAYERS + ({"uuid": "u1", "name": "anna2"}, "garbage"),
+        "tables": ({"tablename": "t1", "players": ("u2", "u9")}, {"tablename": "t2", "players": ()})
+    }
+    lines = ui._format_lobby(state, ui._index_players(state))
+
+    assert lines == [
+        "Lobby:",
+        "  Players:",
+        "    - anna",
+        "    - bob",
+        "    - anna2",
+        "  Tables:",
+        "    - t1 (Players: bob, Unknown(u9))",
+        "    - t2 (Players: None)"
+    ]
+
+def test_get_screen_reuses_frame_until_state_or_token_changes():
+    """Test that an unchanged lobby snapshot and token reuse the formatted frame"""
+    state = {"players": PLAYERS, "tables": ()}
+    frame = ui._get_screen(state, "u1")
+
+    assert ui._get_screen(state, "u1") is frame
+    assert "\nConnected as: anna" in frame
+    assert ui._get_screen(state, None) is not frame
+    assert ui._get_screen({"players": PLAYERS, "tables": ()}, "u1") is not frame